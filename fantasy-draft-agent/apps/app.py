@@ -8,38 +8,44 @@ import os
 import time
 import gradio as gr
 import asyncio
-import nest_asyncio
-from typing import List, Tuple, Optional, Dict
 from dotenv import load_dotenv
 import sys
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from core.agent import FantasyDraftAgent
-from core.data import TOP_PLAYERS
+# Load environment variables before project modules read them at import
+load_dotenv()
+
+from core.data import PLAYER_LABELS
 from core.constants import (
+    DEBUG_LOGGING,
     TYPING_DELAY_SECONDS,
     MESSAGE_DELAY_SECONDS,
 )
 
-from apps.multiagent_draft import MultiAgentMockDraft
 from apps.multiagent_scenarios import (
     run_interactive_mock_draft,
-    format_conversation_block,
     format_agent_message,
-    format_memory_indicator,
     create_mock_draft_visualization
 )
 
-# Apply nest_asyncio for async in Gradio
-nest_asyncio.apply()
+# Only patch the loop when imported inside a running one (e.g. a notebook);
+# Gradio runs our sync generator handlers in worker threads without a loop
+def _in_running_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+if _in_running_loop():
+    import nest_asyncio
+    nest_asyncio.apply()
 
 # Fix for litellm 1.72.4 OpenAI endpoint issue
 os.environ['OPENAI_API_BASE'] = 'https://api.openai.com/v1'
 
-# Load environment variables
-load_dotenv()
-
 
 class FantasyDraftApp:
     def __init__(self):
@@ -53,10 +59,12 @@ class FantasyDraftApp:
         self.current_draft = None
         self.draft_output = ""
         
-        # Debug: Log custom prompts
-        print(f"DEBUG: Starting draft with custom_prompts: {len(self.custom_prompts)} teams customized")
-        for team_num, prompt in self.custom_prompts.items():
-            print(f"DEBUG: Team {team_num} has custom prompt ({len(prompt)} chars)")
+        # Debug: Log custom prompts in a single write
+        if DEBUG_LOGGING:
+            debug_lines = [f"DEBUG: Starting draft with custom_prompts: {len(self.custom_prompts)} teams customized"]
+            for team_num, prompt in self.custom_prompts.items():
+                debug_lines.append(f"DEBUG: Team {team_num} has custom prompt ({len(prompt)} chars)")
+            print("\n".join(debug_lines))
         
         # Use basic multiagent draft with custom prompts
         draft_generator = run_interactive_mock_draft(custom_prompts=self.custom_prompts)
@@ -81,8 +89,11 @@ class FantasyDraftApp:
             yield self.draft_output + "\n\n⚠️ Please enter a player name!"
             return
         
-        # Make the user's pick
+        # Make the user's pick, then start the next AI pick while this one plays back.
+        # Note the pick count first: the prefetched pick lands in all_picks during playback
         messages = self.current_draft.make_user_pick(player_name)
+        total_picks = len(self.current_draft.all_picks)
+        self.current_draft.prefetch_next_turn(total_picks)
         
         # Display messages with inline typing effect
         for msg in messages:
@@ -94,24 +105,22 @@ class FantasyDraftApp:
                     continue
                 else:
                     # Show "..." first for typing effect
-                    typing_placeholder = format_agent_message(agent, recipient, "...")
-                    self.draft_output += typing_placeholder
+                    base_output = self.draft_output
+                    self.draft_output = base_output + format_agent_message(agent, recipient, "...")
                     yield self.draft_output
                     time.sleep(TYPING_DELAY_SECONDS)
                     
                     # Replace "..." with actual message
-                    self.draft_output = self.draft_output.replace(typing_placeholder, "")
-                    self.draft_output += format_agent_message(agent, recipient, content)
+                    self.draft_output = base_output + format_agent_message(agent, recipient, content)
                     yield self.draft_output
                     time.sleep(MESSAGE_DELAY_SECONDS)
         
         # Continue with the rest of the draft
-        yield from self.continue_basic_multiagent_draft()
+        yield from self.continue_basic_multiagent_draft(total_picks)
     
-    def continue_basic_multiagent_draft(self):
-        """Continue basic multiagent draft after user pick."""
+    def continue_basic_multiagent_draft(self, total_picks: int):
+        """Continue basic multiagent draft after the user's pick (total_picks picks made)."""
         # Calculate where we are
-        total_picks = len([p for picks in self.current_draft.draft_board.values() for p in picks])
         current_round = ((total_picks - 1) // 6) + 1
         
         # Continue from where we left off
@@ -148,14 +157,11 @@ class FantasyDraftApp:
                     advisor = self.current_draft.user_advisor
                     
                     # Get available players
-                    all_picked = [p for picks in self.current_draft.draft_board.values() for p in picks]
-                    available = [p for p in TOP_PLAYERS.keys() if p not in all_picked]
-                    
-                    # Get other agent strategies for advisor context
-                    strategies = {f"Team {i}": agent.strategy for i, agent in self.current_draft.agents.items()}
+                    available = self.current_draft.get_available_players()
                     
                     # Get advisor recommendation
-                    advice = advisor.advise_user(available, self.current_draft.draft_board, strategies)
+                    advice = advisor.advise_user(available, self.current_draft.draft_board,
+                                                 self.current_draft.strategies)
                     
                     # Show advisor message
                     self.draft_output += format_agent_message(advisor, "USER", advice)
@@ -165,23 +171,37 @@ class FantasyDraftApp:
                     yield self.draft_output + "\n<!--USER_TURN-->"
                     return
                 else:
-                    # AI agent pick
-                    messages, _ = self.current_draft.simulate_draft_turn(round_num, pick_num, team_num)
+                    # Show loading indicator while the agent's LLM calls run
+                    if team_num in self.current_draft.agents:
+                        agent = self.current_draft.agents[team_num]
+                        loading_msg = f"💭 *{agent.team_name} is contemplating their pick...*"
+                        self.draft_output += format_agent_message("system", "ALL", loading_msg)
+                        yield self.draft_output
+                    
+                    # AI agent pick; the following pick runs while this one plays back
+                    messages, _ = self.current_draft.take_draft_turn(round_num, pick_num, team_num)
+                    self.current_draft.prefetch_next_turn(pick_num)
                     
                     # Display messages with typing effect
                     for msg in messages:
                         if len(msg) >= 3:
                             agent, recipient, content = msg[:3]
                             
+                            # Typing indicators are already the animation - render them once
+                            if isinstance(agent, str) and agent.startswith("typing_"):
+                                self.draft_output += format_agent_message(agent, recipient, content)
+                                yield self.draft_output
+                                time.sleep(TYPING_DELAY_SECONDS)
+                                continue
+                            
                             # Show "..." first for typing effect
-                            typing_placeholder = format_agent_message(agent, recipient, "...")
-                            self.draft_output += typing_placeholder
+                            base_output = self.draft_output
+                            self.draft_output = base_output + format_agent_message(agent, recipient, "...")
                             yield self.draft_output
                             time.sleep(TYPING_DELAY_SECONDS)
                             
                             # Replace with actual message
-                            self.draft_output = self.draft_output.replace(typing_placeholder, "")
-                            self.draft_output += format_agent_message(agent, recipient, content)
+                            self.draft_output = base_output + format_agent_message(agent, recipient, content)
                             yield self.draft_output
                             time.sleep(MESSAGE_DELAY_SECONDS)
                     
@@ -552,11 +572,11 @@ BE ANALYTICAL! BE MERCILESS! TRUST THE PROCESS! 🤖""",
                 # Get available players
                 if app and app.current_draft:
                     available = app.current_draft.get_available_players()
-                    available_text = "Available Players:\n\n"
-                    for player in sorted(available)[:20]:  # Show top 20
-                        if player in TOP_PLAYERS:
-                            info = TOP_PLAYERS[player]
-                            available_text += f"• {player} ({info['pos']}, {info['team']})\n"
+                    available_text = "Available Players:\n\n" + "".join(
+                        f"• {PLAYER_LABELS[player]}\n"
+                        for player in sorted(available)[:20]  # Show top 20
+                        if player in PLAYER_LABELS
+                    )
                 else:
                     available_text = "No draft active"
                 
@@ -632,26 +652,27 @@ BE ANALYTICAL! BE MERCILESS! TRUST THE PROCESS! 🤖""",
                 
             except Exception as e:
                 import traceback
+                error_text = str(e)
                 error_msg = f"## ❌ Error Starting Draft\n\n"
                 error_msg += f"**Error Type:** {type(e).__name__}\n"
-                error_msg += f"**Error Message:** {str(e)}\n\n"
+                error_msg += f"**Error Message:** {error_text}\n\n"
                 
                 # Get the full traceback
                 tb_str = traceback.format_exc()
                 print(f"Full error traceback:\n{tb_str}")  # Log to console
                 
                 # Check for common issues
-                if "OPENAI_API_KEY" in str(e) or "api_key" in str(e).lower():
+                if "OPENAI_API_KEY" in error_text or "api_key" in error_text.lower():
                     error_msg += "**Solution:** Please set your OpenAI API key in Hugging Face Space Settings:\n"
                     error_msg += "1. Go to Settings → Repository secrets\n"
                     error_msg += "2. Add a new secret named `OPENAI_API_KEY`\n"
                     error_msg += "3. Paste your OpenAI API key as the value\n"
                     error_msg += "4. Restart the Space\n"
-                elif "NoneType" in str(e):
+                elif "NoneType" in error_text:
                     error_msg += "**Details:** A required value is None. This might be a configuration issue.\n"
                     error_msg += "Please check the console logs for the full error trace.\n"
                 else:
-                    error_msg += "**Full error:** " + str(e)[:500] + "...\n" if len(str(e)) > 500 else str(e) + "\n"
+                    error_msg += "**Full error:** " + error_text[:500] + "...\n" if len(error_text) > 500 else error_text + "\n"
                     error_msg += "\nPlease check the console logs for more details.\n"
                 
                 yield error_msg, app, gr.update(), gr.update(), gr.update(), ""
@@ -5,22 +5,44 @@ Demonstrates agent communication and multi-turn memory
 """
 
 import time
-from typing import Dict, List, Tuple, Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, NamedTuple, Tuple, Optional
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from core.agent import FantasyDraftAgent
-from core.data import TOP_PLAYERS, get_best_available, get_players_by_position
+from core.constants import DEBUG_LOGGING, RECENT_MEMORY_SIZE, AGENT_MAX_TOKENS, ADVISOR_MAX_TOKENS
+from core.data import TOP_PLAYERS, PLAYERS_BY_ADP, get_best_available, get_players_by_position
 import random
 
 # Enhanced agents not available in the reorganized structure
 USE_ENHANCED = False
 
 
+class ConversationEntry(NamedTuple):
+    """One remembered exchange in an agent's conversation memory."""
+    speaker: str
+    message: str
+    timestamp: float
+
+
+class DraftLogEntry(NamedTuple):
+    """One confirmed pick in the commissioner's draft log."""
+    pick_num: int
+    team: str
+    player: str
+
+
 class DraftAgent:
     """Base class for draft agents with specific strategies."""
     
+    # Reasoning used when no player could be chosen
+    fallback_reasoning = "Taking the best available..."
+    # Longest completion the agent's LLM may return
+    max_tokens = AGENT_MAX_TOKENS
+    
     def __init__(self, team_name: str, strategy: str, color: str, icon: str, custom_instructions: Optional[str] = None):
         self.team_name = team_name
         self.strategy = strategy
@@ -29,34 +51,50 @@ class DraftAgent:
         self.custom_instructions = custom_instructions
         
         # Debug: Log if custom instructions are received
-        if custom_instructions:
-            print(f"DEBUG: {team_name} initialized WITH custom instructions ({len(custom_instructions)} chars)")
-        else:
-            print(f"DEBUG: {team_name} initialized WITHOUT custom instructions")
+        if DEBUG_LOGGING:
+            if custom_instructions:
+                print(f"DEBUG: {team_name} initialized WITH custom instructions ({len(custom_instructions)} chars)")
+            else:
+                print(f"DEBUG: {team_name} initialized WITHOUT custom instructions")
         
         # Create agent with custom instructions if provided
         if custom_instructions:
-            self.agent = FantasyDraftAgent(custom_instructions=custom_instructions)
+            self.agent = FantasyDraftAgent(custom_instructions=custom_instructions, max_tokens=self.max_tokens)
         else:
-            self.agent = FantasyDraftAgent()
+            self.agent = FantasyDraftAgent(max_tokens=self.max_tokens)
             
         self.picks = []
-        self.conversation_memory = []
+        self.picks_str = ""  # ', '.join(self.picks), kept in sync by record_pick
+        
+        # Only the most recent exchanges are ever fed back to the LLM
+        self.conversation_memory = deque(maxlen=RECENT_MEMORY_SIZE)
         
 
+    def record_pick(self, player: str):
+        """Add a player to this team's picks."""
+        self.picks.append(player)
+        self.picks_str = f"{self.picks_str}, {player}" if self.picks_str else player
+    
     def remember_conversation(self, speaker: str, message: str):
         """Store conversation in memory."""
-        self.conversation_memory.append({
-            "speaker": speaker,
-            "message": message,
-            "timestamp": time.time()
-        })
+        self.conversation_memory.append(ConversationEntry(speaker, message, time.time()))
     
-    def make_pick(self, available_players: List[str], draft_board: Dict) -> Tuple[str, str]:
-        """Make a pick based on strategy. Returns (player, reasoning)."""
+    def choose_pick(self, available_players: List[str], draft_board: Dict) -> Tuple[str, Optional[str]]:
+        """Choose a player based on strategy. Returns (player, reasoning prompt)."""
         # This will be overridden by specific agent types
         pass
     
+    def explain_pick(self, context: Optional[str]) -> str:
+        """Generate the reasoning for a chosen pick using LLM."""
+        if context is None:
+            return self.fallback_reasoning
+        return self.agent.run(context).strip()
+    
+    def make_pick(self, available_players: List[str], draft_board: Dict) -> Tuple[str, str]:
+        """Make a pick based on strategy. Returns (player, reasoning)."""
+        player, context = self.choose_pick(available_players, draft_board)
+        return player, self.explain_pick(context)
+    
     def comment_on_pick(self, team: str, player: str, player_info: Dict) -> Optional[str]:
         """Generate commentary on another team's pick using LLM."""
         # Build context for the LLM
@@ -72,14 +110,14 @@ class DraftAgent:
 
 CURRENT SITUATION:
 - You are {self.team_name}
-- Your picks so far: {', '.join(self.picks) if self.picks else 'None yet'}
+- Your picks so far: {self.picks_str or 'None yet'}
 - {team} just picked {player} ({player_info['pos']}, {adp_description}, Tier: {player_info['tier']})
 
 Provide a short comment on this pick based on your personality and strategy. Keep it under 2 sentences."""
         else:
             # Use default context
             context = f"""You are {self.team_name}, a fantasy football team manager following a {self.strategy}.
-Your picks so far: {', '.join(self.picks) if self.picks else 'None yet'}
+Your picks so far: {self.picks_str or 'None yet'}
 
 {team} just picked {player} ({player_info['pos']}, {adp_description}, Tier: {player_info['tier']}).
 
@@ -95,7 +133,7 @@ IMPORTANT: Don't mention raw ADP numbers like "1.5" - use natural language like
     def respond_to_comment(self, commenter: str, comment: str) -> Optional[str]:
         """Respond to another agent's comment using LLM."""
         # Build conversation context
-        recent_memory = self.conversation_memory[-5:] if len(self.conversation_memory) > 5 else self.conversation_memory
+        recent_memory = self.conversation_memory
         
         if self.custom_instructions:
             # Use custom instructions with minimal context
@@ -103,19 +141,19 @@ IMPORTANT: Don't mention raw ADP numbers like "1.5" - use natural language like
 
 CURRENT SITUATION:
 - You are {self.team_name}
-- Your picks: {', '.join(self.picks) if self.picks else 'None yet'}
+- Your picks: {self.picks_str or 'None yet'}
 - {commenter} just said to you: "{comment}"
 
 Respond based on your personality. Keep it to 1-2 sentences."""
         else:
             # Use default context
             context = f"""You are {self.team_name}, following a {self.strategy} in a fantasy draft.
-Your picks: {', '.join(self.picks) if self.picks else 'None yet'}
+Your picks: {self.picks_str or 'None yet'}
 
 {commenter} just said to you: "{comment}"
 
 Recent conversation history:
-{chr(10).join([f"- {m['speaker']}: {m['message']}" for m in recent_memory])}
+{chr(10).join([f"- {m.speaker}: {m.message}" for m in recent_memory])}
 
 Respond naturally and briefly (1-2 sentences). Be competitive and defend your strategy aggressively.
 You can be sarcastic, dismissive, or fire back with your own trash talk. This is a competition!
@@ -128,22 +166,23 @@ Don't be polite - show confidence and give as good as you get."""
 class ZeroRBAgent(DraftAgent):
     """Agent that follows Zero RB strategy."""
     
+    fallback_reasoning = "Hmm, slim pickings here..."
+    
     def __init__(self, team_name: str, custom_instructions: Optional[str] = None):
         super().__init__(team_name, "Zero RB Strategy", "#E3F2FD", "📘", custom_instructions)
         self.person_emoji = "🤓"  # Analytical nerd
     
-    def make_pick(self, available_players: List[str], draft_board: Dict) -> Tuple[str, str]:
+    def choose_pick(self, available_players: List[str], draft_board: Dict) -> Tuple[str, Optional[str]]:
+        available = set(available_players)
         # Prioritize WRs in early rounds
         round_num = len(self.picks) + 1
         
         if round_num <= 3:
             # Get best available WR
-            best_wrs = [(p, info) for p, info in TOP_PLAYERS.items() 
-                       if p in available_players and info['pos'] == 'WR']
-            if best_wrs:
-                best_wrs.sort(key=lambda x: x[1]['adp'])
-                player = best_wrs[0][0]
-                player_info = best_wrs[0][1]
+            best_wr = next((p for p in PLAYERS_BY_ADP if p in available and TOP_PLAYERS[p]['pos'] == 'WR'), None)
+            if best_wr:
+                player = best_wr
+                player_info = TOP_PLAYERS[player]
                 
                 # Generate dynamic reasoning using LLM
                 # Convert ADP to readable format
@@ -161,14 +200,14 @@ class ZeroRBAgent(DraftAgent):
 
 CURRENT SITUATION:
 - You are {self.team_name} in round {round_num}
-- Your previous picks: {', '.join(self.picks) if self.picks else 'None'}
+- Your previous picks: {self.picks_str or 'None'}
 - You're selecting {player} (WR, {player_info['team']}, {adp_desc})
 
 Explain your pick in 1-2 sentences based on your personality and strategy."""
                 else:
                     # Use default context  
                     context = f"""You are {self.team_name} following a Zero RB strategy in round {round_num}.
-Your previous picks: {', '.join(self.picks) if self.picks else 'None'}
+Your previous picks: {self.picks_str or 'None'}
 
 You're selecting {player} (WR, {player_info['team']}, {adp_desc}).
 
@@ -177,17 +216,14 @@ Be confident and maybe a bit cocky about avoiding RBs. Take subtle shots at team
 Show personality - you KNOW your strategy is superior.
 Don't use raw numbers like "1.5" or "ADP 12" - use natural language."""
                 
-                reasoning = self.agent.run(context).strip()
-                return player, reasoning
+                return player, context
         
         # Later rounds, grab RBs
-        best_available = [(p, info) for p, info in TOP_PLAYERS.items() 
-                         if p in available_players]
-        best_available.sort(key=lambda x: x[1]['adp'])
+        best_player = next((p for p in PLAYERS_BY_ADP if p in available), None)
         
-        if best_available:
-            player = best_available[0][0]
-            player_info = best_available[0][1]
+        if best_player:
+            player = best_player
+            player_info = TOP_PLAYERS[player]
             pos = player_info['pos']
             
             # Convert ADP to readable format
@@ -203,14 +239,14 @@ Don't use raw numbers like "1.5" or "ADP 12" - use natural language."""
 
 CURRENT SITUATION:
 - You are {self.team_name} in round {round_num}
-- Your previous picks: {', '.join(self.picks)}
+- Your previous picks: {self.picks_str}
 - You're selecting {player} ({pos}, {player_info['team']}, {adp_desc})
 
 Explain your pick in 1-2 sentences based on your personality and strategy."""
             else:
                 # Use default context
                 context = f"""You are {self.team_name} following a Zero RB strategy in round {round_num}.
-Your previous picks: {', '.join(self.picks)}
+Your previous picks: {self.picks_str}
 
 You're selecting {player} ({pos}, {player_info['team']}, {adp_desc}).
 
@@ -219,10 +255,9 @@ If it's a RB, explain why NOW is the right time (while others reached early).
 Be smug about getting value while others panicked. Keep it to 1-2 sentences with attitude.
 Use terms like "value", "steal", "while others reached" - not raw numbers."""
             
-            reasoning = self.agent.run(context).strip()
-            return player, reasoning
+            return player, context
         
-        return "Unknown Player", "Hmm, slim pickings here..."
+        return "Unknown Player", None
     
 
 
@@ -234,15 +269,14 @@ class BPAAgent(DraftAgent):
         super().__init__(team_name, "Best Player Available", "#E8F5E9", "📗", custom_instructions)
         self.person_emoji = "🧑‍💼"  # Business-like, calculated
     
-    def make_pick(self, available_players: List[str], draft_board: Dict) -> Tuple[str, str]:
+    def choose_pick(self, available_players: List[str], draft_board: Dict) -> Tuple[str, Optional[str]]:
+        available = set(available_players)
         # Simply take the best available by ADP
-        best_available = [(p, info) for p, info in TOP_PLAYERS.items() 
-                         if p in available_players]
-        best_available.sort(key=lambda x: x[1]['adp'])
+        best_player = next((p for p in PLAYERS_BY_ADP if p in available), None)
         
-        if best_available:
-            player = best_available[0][0]
-            player_info = best_available[0][1]
+        if best_player:
+            player = best_player
+            player_info = TOP_PLAYERS[player]
             pos = player_info['pos']
             
             # Generate dynamic reasoning using LLM
@@ -261,14 +295,14 @@ class BPAAgent(DraftAgent):
 
 CURRENT SITUATION:
 - You are {self.team_name} in round {len(self.picks) + 1}
-- Your previous picks: {', '.join(self.picks) if self.picks else 'None'}
+- Your previous picks: {self.picks_str or 'None'}
 - You're selecting {player} ({pos}, {player_info['team']}, {adp_desc})
 
 Explain your pick in 1-2 sentences based on your personality and strategy."""
             else:
                 # Use default context
                 context = f"""You are {self.team_name} following a Best Player Available strategy.
-Your previous picks: {', '.join(self.picks) if self.picks else 'None'}
+Your previous picks: {self.picks_str or 'None'}
 Round: {len(self.picks) + 1}
 
 You're selecting {player} ({pos}, {player_info['team']}, {adp_desc}).
@@ -278,10 +312,9 @@ Be condescending about other teams reaching for needs or following rigid strateg
 You're the smart one taking the obvious value - let them know it. Keep it to 1-2 sentences.
 Don't use raw ADP numbers - use terms like "best available", "top-ranked", "obvious value", etc."""
             
-            reasoning = self.agent.run(context).strip()
-            return player, reasoning
+            return player, context
         
-        return "Unknown Player", "Taking the best available..."
+        return "Unknown Player", None
     
 
 
@@ -289,22 +322,23 @@ Don't use raw ADP numbers - use terms like "best available", "top-ranked", "obvi
 class RobustRBAgent(DraftAgent):
     """Agent that follows Robust RB strategy."""
     
+    fallback_reasoning = "Building around my RBs..."
+    
     def __init__(self, team_name: str, custom_instructions: Optional[str] = None):
         super().__init__(team_name, "Robust RB Strategy", "#FFF3E0", "📙", custom_instructions)
         self.person_emoji = "🧔"  # Old-school, traditional
     
-    def make_pick(self, available_players: List[str], draft_board: Dict) -> Tuple[str, str]:
+    def choose_pick(self, available_players: List[str], draft_board: Dict) -> Tuple[str, Optional[str]]:
+        available = set(available_players)
         # Prioritize RBs early
         round_num = len(self.picks) + 1
         
         if round_num <= 2:
             # Get best available RB
-            best_rbs = [(p, info) for p, info in TOP_PLAYERS.items() 
-                       if p in available_players and info['pos'] == 'RB']
-            if best_rbs:
-                best_rbs.sort(key=lambda x: x[1]['adp'])
-                player = best_rbs[0][0]
-                player_info = best_rbs[0][1]
+            best_rb = next((p for p in PLAYERS_BY_ADP if p in available and TOP_PLAYERS[p]['pos'] == 'RB'), None)
+            if best_rb:
+                player = best_rb
+                player_info = TOP_PLAYERS[player]
                 
                 # Convert ADP to readable format
                 adp_int = int(player_info['adp'])
@@ -321,14 +355,14 @@ class RobustRBAgent(DraftAgent):
 
 CURRENT SITUATION:
 - You are {self.team_name} in round {round_num}
-- Your previous picks: {', '.join(self.picks) if self.picks else 'None'}
+- Your previous picks: {self.picks_str or 'None'}
 - You're selecting {player} (RB, {player_info['team']}, {adp_desc})
 
 Explain your pick in 1-2 sentences based on your personality and strategy."""
                 else:
                     # Use default context
                     context = f"""You are {self.team_name} following a Robust RB strategy in round {round_num}.
-Your previous picks: {', '.join(self.picks) if self.picks else 'None'}
+Your previous picks: {self.picks_str or 'None'}
 
 You're selecting {player} (RB, {player_info['team']}, {adp_desc}).
 
@@ -337,17 +371,14 @@ Mock teams that are going WR-heavy. You're building a REAL team with a strong fo
 Be old-school and dismissive of "fancy" WR strategies. Keep it to 1-2 sentences with authority.
 Use terms like "workhorse", "bell cow", "foundation" - not raw numbers."""
                 
-                reasoning = self.agent.run(context).strip()
-                return player, reasoning
+                return player, context
         
         # Best available after that
-        best_available = [(p, info) for p, info in TOP_PLAYERS.items() 
-                         if p in available_players]
-        best_available.sort(key=lambda x: x[1]['adp'])
+        best_player = next((p for p in PLAYERS_BY_ADP if p in available), None)
         
-        if best_available:
-            player = best_available[0][0]
-            player_info = best_available[0][1]
+        if best_player:
+            player = best_player
+            player_info = TOP_PLAYERS[player]
             
             # Convert ADP to readable format
             adp_int = int(player_info['adp'])
@@ -365,14 +396,14 @@ Use terms like "workhorse", "bell cow", "foundation" - not raw numbers."""
 
 CURRENT SITUATION:
 - You are {self.team_name} in round {round_num}
-- Your previous picks: {', '.join(self.picks)}
+- Your previous picks: {self.picks_str}
 - You're selecting {player} ({player_info['pos']}, {player_info['team']}, {adp_desc})
 
 Explain your pick in 1-2 sentences based on your personality and strategy."""
             else:
                 # Use default context
                 context = f"""You are {self.team_name} following a Robust RB strategy in round {round_num}.
-Your previous picks: {', '.join(self.picks)}
+Your previous picks: {self.picks_str}
 
 You're selecting {player} ({player_info['pos']}, {player_info['team']}, {adp_desc}).
 
@@ -380,24 +411,25 @@ Explain how this pick fits with your RB-heavy build. If it's not a RB, grudgingl
 But emphasize your RB foundation is what matters. Be dismissive of WR-first teams. Keep it to 1-2 sentences.
 Focus on your "foundation" and "championship formula" - avoid raw rankings."""
             
-            reasoning = self.agent.run(context).strip()
-            return player, reasoning
+            return player, context
         
-        return "Unknown Player", "Building around my RBs..."
+        return "Unknown Player", None
 
 
 class UpsideAgent(DraftAgent):
     """Agent that hunts for upside/breakout players."""
     
+    fallback_reasoning = "Going for the home run pick..."
+    
     def __init__(self, team_name: str, custom_instructions: Optional[str] = None):
         super().__init__(team_name, "Upside Hunter", "#FFFDE7", "📓", custom_instructions)
         self.person_emoji = "🤠"  # Risk-taking cowboy
     
-    def make_pick(self, available_players: List[str], draft_board: Dict) -> Tuple[str, str]:
+    def choose_pick(self, available_players: List[str], draft_board: Dict) -> Tuple[str, Optional[str]]:
+        available = set(available_players)
         # Look for high upside players
-        best_available = [(p, info) for p, info in TOP_PLAYERS.items() 
-                         if p in available_players]
-        best_available.sort(key=lambda x: x[1]['adp'])
+        best_available = [(p, TOP_PLAYERS[p]) for p in PLAYERS_BY_ADP 
+                         if p in available]
         
         # Sometimes reach for upside
         if len(best_available) > 3 and random.random() > 0.5:
@@ -415,14 +447,14 @@ class UpsideAgent(DraftAgent):
 
 CURRENT SITUATION:
 - You are {self.team_name} in round {len(self.picks) + 1}
-- Your previous picks: {', '.join(self.picks) if self.picks else 'None'}
+- Your previous picks: {self.picks_str or 'None'}
 - You're reaching slightly for {player} ({player_info['pos']}, {player_info['team']}, {adp_desc})
 
 Explain your pick in 1-2 sentences based on your personality and strategy."""
             else:
                 # Use default context
                 context = f"""You are {self.team_name}, an Upside Hunter who looks for breakout potential.
-Your previous picks: {', '.join(self.picks) if self.picks else 'None'}
+Your previous picks: {self.picks_str or 'None'}
 Round: {len(self.picks) + 1}
 
 You're reaching slightly for {player} ({player_info['pos']}, {player_info['team']}, {adp_desc}).
@@ -432,8 +464,7 @@ Mock the "safe" picks others are making. You're here to WIN, not finish 4th!
 Championships require RISK! Keep it to 1-2 sentences with swagger.
 Talk about "upside", "ceiling", "league-winner" - not specific rankings."""
             
-            reasoning = self.agent.run(context).strip()
-            return player, reasoning
+            return player, context
             
         elif best_available:
             player = best_available[0][0]
@@ -454,14 +485,14 @@ Talk about "upside", "ceiling", "league-winner" - not specific rankings."""
 
 CURRENT SITUATION:
 - You are {self.team_name} in round {len(self.picks) + 1}
-- Your previous picks: {', '.join(self.picks) if self.picks else 'None'}
+- Your previous picks: {self.picks_str or 'None'}
 - You're selecting {player} ({player_info['pos']}, {player_info['team']}, {adp_desc})
 
 Explain your pick in 1-2 sentences based on your personality and strategy."""
             else:
                 # Use default context
                 context = f"""You are {self.team_name}, an Upside Hunter who looks for league-winners.
-Your previous picks: {', '.join(self.picks) if self.picks else 'None'}
+Your previous picks: {self.picks_str or 'None'}
 Round: {len(self.picks) + 1}
 
 You're selecting {player} ({player_info['pos']}, {player_info['team']}, {adp_desc}).
@@ -471,15 +502,16 @@ Be dismissive of "safe" boring picks. You're building a championship roster, not
 Keep it to 1-2 sentences with confidence.
 Use exciting terms like "breakout", "league-winner", "explosive" - not rankings."""
             
-            reasoning = self.agent.run(context).strip()
-            return player, reasoning
+            return player, context
         
-        return "Unknown Player", "Going for the home run pick..."
+        return "Unknown Player", None
 
 
 class UserAdvisorAgent(DraftAgent):
     """Agent that advises the user during their picks."""
     
+    max_tokens = ADVISOR_MAX_TOKENS
+    
     def __init__(self, custom_instructions: Optional[str] = None):
         super().__init__("Your Advisor", "Strategic Advisor", "#FFEBEE", "📕", custom_instructions)
         self.person_emoji = "🧙"  # Wise advisor
@@ -492,19 +524,31 @@ class UserAdvisorAgent(DraftAgent):
         total_picks = sum(len(picks) for picks in draft_board.values())
         round_num = (total_picks // 6) + 1  # 6 teams per round
         
-        # Get best available by position
+        # Get best available by position in a single pass over the ADP order
+        available = set(available_players)
         best_by_pos = {}
+        for p in PLAYERS_BY_ADP:
+            info = TOP_PLAYERS[p]
+            if info['pos'] in ('RB', 'WR', 'QB', 'TE') and info['pos'] not in best_by_pos and p in available:
+                best_by_pos[info['pos']] = (p, info)
+                if len(best_by_pos) == 4:
+                    break
+        
+        # Format the best-available lines once for either prompt variant
+        best_lines = []
         for pos in ['RB', 'WR', 'QB', 'TE']:
-            candidates = [(p, info) for p, info in TOP_PLAYERS.items() 
-                         if p in available_players and info['pos'] == pos]
-            if candidates:
-                candidates.sort(key=lambda x: x[1]['adp'])
-                best_by_pos[pos] = candidates[0]
+            best = best_by_pos.get(pos)
+            ranking = f"(ranked #{int(best[1]['adp'])})" if best else ""
+            best_lines.append(f"Best {pos}: {best[0] if best else None} {ranking}")
         
         # Get user's current roster
-        user_picks = self.user_picks
-        user_rbs = [p for p in user_picks if TOP_PLAYERS.get(p, {}).get('pos') == 'RB']
-        user_wrs = [p for p in user_picks if TOP_PLAYERS.get(p, {}).get('pos') == 'WR']
+        user_rbs, user_wrs = [], []
+        for p in self.user_picks:
+            pos = TOP_PLAYERS[p]['pos'] if p in TOP_PLAYERS else None
+            if pos == 'RB':
+                user_rbs.append(p)
+            elif pos == 'WR':
+                user_wrs.append(p)
         
         # Analyze what other teams have been doing
         other_picks_summary = []
@@ -525,10 +569,7 @@ CURRENT SITUATION:
   - RBs: {', '.join(user_rbs) if user_rbs else 'None'}
   - WRs: {', '.join(user_wrs) if user_wrs else 'None'}
 - Top available players:
-  - Best RB: {best_by_pos.get('RB', [None])[0]} {f"(ranked #{int(best_by_pos.get('RB', [None, {'adp': 999}])[1]['adp'])})" if best_by_pos.get('RB') else ""}
-  - Best WR: {best_by_pos.get('WR', [None])[0]} {f"(ranked #{int(best_by_pos.get('WR', [None, {'adp': 999}])[1]['adp'])})" if best_by_pos.get('WR') else ""}
-  - Best QB: {best_by_pos.get('QB', [None])[0]} {f"(ranked #{int(best_by_pos.get('QB', [None, {'adp': 999}])[1]['adp'])})" if best_by_pos.get('QB') else ""}
-  - Best TE: {best_by_pos.get('TE', [None])[0]} {f"(ranked #{int(best_by_pos.get('TE', [None, {'adp': 999}])[1]['adp'])})" if best_by_pos.get('TE') else ""}
+{chr(10).join(f"  - {line}" for line in best_lines)}
 
 Provide strategic advice for the user's pick based on your personality."""
         else:
@@ -540,10 +581,7 @@ User's current roster:
 - WRs: {', '.join(user_wrs) if user_wrs else 'None'}
 
 Top available players:
-- Best RB: {best_by_pos.get('RB', [None])[0]} {f"(ranked #{int(best_by_pos.get('RB', [None, {'adp': 999}])[1]['adp'])})" if best_by_pos.get('RB') else ""}
-- Best WR: {best_by_pos.get('WR', [None])[0]} {f"(ranked #{int(best_by_pos.get('WR', [None, {'adp': 999}])[1]['adp'])})" if best_by_pos.get('WR') else ""}
-- Best QB: {best_by_pos.get('QB', [None])[0]} {f"(ranked #{int(best_by_pos.get('QB', [None, {'adp': 999}])[1]['adp'])})" if best_by_pos.get('QB') else ""}
-- Best TE: {best_by_pos.get('TE', [None])[0]} {f"(ranked #{int(best_by_pos.get('TE', [None, {'adp': 999}])[1]['adp'])})" if best_by_pos.get('TE') else ""}
+{chr(10).join(f"- {line}" for line in best_lines)}
 
 Recent picks by other teams:
 {chr(10).join(other_picks_summary[-3:]) if other_picks_summary else 'None yet'}
@@ -578,11 +616,7 @@ class CommissionerAgent:
     
     def confirm_pick(self, team: str, player: str, pick_num: int) -> str:
         """Confirm a pick was made."""
-        self.draft_log.append({
-            "pick_num": pick_num,
-            "team": team,
-            "player": player
-        })
+        self.draft_log.append(DraftLogEntry(pick_num, team, player))
         return f"With pick #{pick_num}, {team} selects **{player}**!"
     
     def announce_round_end(self, round_num: int) -> str:
@@ -597,10 +631,12 @@ class MultiAgentMockDraft:
         # Initialize agents with custom prompts if provided
         self.custom_prompts = custom_prompts or {}
         
-        # Debug: Log custom prompts
-        print(f"DEBUG: MultiAgentMockDraft received custom_prompts: {len(self.custom_prompts)} teams")
-        for team_num, prompt in self.custom_prompts.items():
-            print(f"DEBUG: Team {team_num} custom prompt: {prompt[:50]}..." if prompt else f"DEBUG: Team {team_num} has no custom prompt")
+        # Debug: Log custom prompts in a single write
+        if DEBUG_LOGGING:
+            debug_lines = [f"DEBUG: MultiAgentMockDraft received custom_prompts: {len(self.custom_prompts)} teams"]
+            for team_num, prompt in self.custom_prompts.items():
+                debug_lines.append(f"DEBUG: Team {team_num} custom prompt: {prompt[:50]}..." if prompt else f"DEBUG: Team {team_num} has no custom prompt")
+            print("\n".join(debug_lines))
         
         self.agents = {
             1: ZeroRBAgent("Team 1", self.custom_prompts.get(1)),
@@ -616,6 +652,9 @@ class MultiAgentMockDraft:
         
         self.user_position = user_pick_position
         self.user_advisor = UserAdvisorAgent()
+        
+        # Strategies don't change mid-draft, so build the advisor's view once
+        self.strategies = {f"Team {i}": agent.strategy for i, agent in self.agents.items()}
         self.commissioner = CommissionerAgent()
         
         # Draft state
@@ -626,6 +665,14 @@ class MultiAgentMockDraft:
             agent.draft_board = self.draft_board
         
         self.all_picks = []
+        self._picked = set()  # Every drafted player, for O(1) availability checks
+        
+        # Background worker so a pick's reasoning call overlaps the rival's comment
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        
+        # Separate worker that runs the next AI pick while the UI plays back the current one
+        self._turn_executor = ThreadPoolExecutor(max_workers=1)
+        self._prefetched_turn = None
         
         # Conversation log for visualization
         self.conversation_log = []
@@ -643,8 +690,7 @@ class MultiAgentMockDraft:
     
     def get_available_players(self) -> List[str]:
         """Get list of available players."""
-        all_picked = [p for picks in self.draft_board.values() for p in picks]
-        return [p for p in TOP_PLAYERS.keys() if p not in all_picked]
+        return [p for p in TOP_PLAYERS if p not in self._picked]
     
     def format_message(self, agent, recipient: str, message: str) -> str:
         """Format a message with agent styling."""
@@ -676,7 +722,7 @@ class MultiAgentMockDraft:
         
         # Check if it's a position run (3rd player at same position in a row)
         recent_picks = self.all_picks[-3:]
-        recent_positions = [TOP_PLAYERS.get(p[1], {}).get('pos', '') for p in recent_picks]
+        recent_positions = [TOP_PLAYERS[p[1]]['pos'] for p in recent_picks if p[1] in TOP_PLAYERS]
         if recent_positions.count(player_info['pos']) >= 2:
             return True
         
@@ -754,9 +800,7 @@ class MultiAgentMockDraft:
         if team_num == self.user_position:
             # User's turn - get advice
             available = self.get_available_players()
-            strategies = {f"Team {i}": agent.strategy for i, agent in self.agents.items()}
-            
-            advice = self.user_advisor.advise_user(available, self.draft_board, strategies)
+            advice = self.user_advisor.advise_user(available, self.draft_board, self.strategies)
             messages.append(("advisor", "USER", advice))
             
             # Return messages and wait for user input
@@ -769,23 +813,28 @@ class MultiAgentMockDraft:
                 # Create a temporary BPA agent for this team
                 agent = BPAAgent(f"Team {team_num}")
                 self.agents[team_num] = agent
+                self.strategies[f"Team {team_num}"] = agent.strategy
             
             available = self.get_available_players()
             
-            # Agent makes pick
-            player, reasoning = agent.make_pick(available, self.draft_board)
+            # Agent makes pick; its reasoning is generated in the background
+            # while the other agents react to the choice
+            player, pick_context = agent.choose_pick(available, self.draft_board)
+            reasoning_future = self._executor.submit(agent.explain_pick, pick_context)
             
             # Update draft board
             self.draft_board[team_num].append(player)
-            agent.picks.append(player)
+            agent.record_pick(player)
             self.all_picks.append((team_num, player))
+            self._picked.add(player)
             
             # Announce pick
             confirm_msg = self.commissioner.confirm_pick(agent.team_name, player, pick_num)
             messages.append(("commissioner", "ALL", confirm_msg))
             
-            # Agent explains pick
-            messages.append((agent, "ALL", reasoning))
+            # Agent explains pick (filled in once the reasoning is ready)
+            reasoning_index = len(messages)
+            messages.append(None)
             
             # Enhanced features: sometimes add emoji storms and meta commentary
             if USE_ENHANCED and hasattr(agent, 'generate_emoji_storm'):
@@ -837,6 +886,9 @@ class MultiAgentMockDraft:
                             # Enhanced agents respond more often (30% vs 15%)
                             response_chance = 0.70 if USE_ENHANCED else 0.85
                             if random.random() > response_chance:
+                                # The picker's LLM must finish its reasoning before replying
+                                reasoning_future.result()
+                                
                                 # Typing indicator for response
                                 response_typing = (f"typing_{agent.team_name}", other_agent.team_name,
                                                  f"{agent.team_name} is typing...")
@@ -847,21 +899,58 @@ class MultiAgentMockDraft:
                                     messages.append((agent, other_agent.team_name, response))
                                     other_agent.remember_conversation(agent.team_name, response)
             
+            messages[reasoning_index] = (agent, "ALL", reasoning_future.result())
             return messages, player
     
+    def prefetch_next_turn(self, pick_num: int):
+        """Start the pick after pick_num in the background if an AI team makes it.
+        
+        Only picks in the same round are prefetched, so the board drawn at the
+        start of a round never shows a pick before it is announced. Nothing is
+        started unless pick_num is the last pick actually made, so a pick never
+        runs ahead of the user's.
+        """
+        if self._prefetched_turn is not None or pick_num % 6 == 0 or len(self.all_picks) != pick_num:
+            return
+        
+        round_num = ((pick_num - 1) // 6) + 1
+        next_pick = pick_num + 1
+        team_num = self.get_draft_order(round_num)[(next_pick - 1) % 6]
+        if team_num == self.user_position:
+            return
+        
+        future = self._turn_executor.submit(self.simulate_draft_turn, round_num, next_pick, team_num)
+        self._prefetched_turn = ((round_num, next_pick, team_num), future)
+    
+    def take_draft_turn(self, round_num: int, pick_num: int, team_num: int) -> List[str]:
+        """Run a pick, reusing its prefetched result when there is one."""
+        if self._prefetched_turn is not None:
+            key, future = self._prefetched_turn
+            self._prefetched_turn = None
+            # Always wait, so no agent is ever used from two threads at once
+            result = future.result()
+            if key != (round_num, pick_num, team_num):
+                # The prefetched pick is already on the board; running this one
+                # too would leave that pick unannounced
+                raise RuntimeError(
+                    f"Prefetched turn {key} does not match requested turn {(round_num, pick_num, team_num)}"
+                )
+            return result
+        return self.simulate_draft_turn(round_num, pick_num, team_num)
+    
     def make_user_pick(self, player_name: str) -> List[str]:
         """Process the user's pick."""
         messages = []
         
         # Validate pick
-        available = self.get_available_players()
-        if player_name not in available:
+        if player_name not in TOP_PLAYERS or player_name in self._picked:
             return [("advisor", "USER", f"❌ {player_name} is not available!")]
         
         # Make the pick
         self.draft_board[self.user_position].append(player_name)
         self.user_advisor.user_picks.append(player_name)
         self.all_picks.append((self.user_position, player_name))
+        self._picked.add(player_name)
         
         pick_num = len(self.all_picks)
         
@@ -891,24 +980,26 @@ class MultiAgentMockDraft:
     
     def get_draft_summary(self) -> str:
         """Get a summary of the draft results."""
-        summary = "📊 **DRAFT SUMMARY**\n\n"
+        # Collect the summary's parts and join once at the end
+        parts = ["📊 **DRAFT SUMMARY**\n\n"]
         
-        for team_num in sorted(self.draft_board.keys()):
+        # draft_board is built in team order, so insertion order is already sorted
+        for team_num, team_picks in self.draft_board.items():
             if team_num == self.user_position:
-                summary += f"**YOUR TEAM**:\n"
+                parts.append("**YOUR TEAM**:\n")
             else:
                 agent = self.agents.get(team_num)
                 if agent:
-                    summary += f"**{agent.team_name}** ({agent.strategy}):\n"
+                    parts.append(f"**{agent.team_name}** ({agent.strategy}):\n")
                 else:
-                    summary += f"**Team {team_num}**:\n"
+                    parts.append(f"**Team {team_num}**:\n")
             
-            for i, player in enumerate(self.draft_board[team_num], 1):
-                if player in TOP_PLAYERS:
-                    info = TOP_PLAYERS[player]
-                    summary += f"  R{i}: {player} ({info['pos']}, {info['team']})\n"
+            for i, player in enumerate(team_picks, 1):
+                info = TOP_PLAYERS.get(player)
+                if info:
+                    parts.append(f"  R{i}: {player} ({info['pos']}, {info['team']})\n")
                 else:
-                    summary += f"  R{i}: {player}\n"
-            summary += "\n"
+                    parts.append(f"  R{i}: {player}\n")
+            parts.append("\n")
         
-        return summary 
\ No newline at end of file
+        return "".join(parts) 
\ No newline at end of file
@@ -8,6 +8,37 @@ from .multiagent_draft import MultiAgentMockDraft, DraftAgent, CommissionerAgent
 import time
 
 
+# Agent colors and styles, keyed by icon: (name, background, border)
+AGENT_STYLES = {
+    "📘": ("Team 1", "#E3F2FD", "#1976D2"),  # Blue
+    "📘🤓": ("Team 1", "#E3F2FD", "#1976D2"),  # Blue with nerd emoji
+    "📗": ("Team 2", "#E8F5E9", "#388E3C"),  # Green
+    "📗🧑‍💼": ("Team 2", "#E8F5E9", "#388E3C"),  # Green with business person
+    "📗👨‍🏫": ("Team 6", "#E8F5E9", "#388E3C"),  # Green with professor
+    "📙": ("Team 3", "#FFF3E0", "#F57C00"),  # Orange
+    "📙🧔": ("Team 3", "#FFF3E0", "#F57C00"),  # Orange with beard
+    "📕": ("Your Advisor", "#FFEBEE", "#D32F2F"),  # Red
+    "📕🧙": ("Your Advisor", "#FFEBEE", "#D32F2F"),  # Red with wizard
+    "📓": ("Team 5", "#F5E6FF", "#7B1FA2"),  # Purple
+    "📓🤠": ("Team 5", "#F5E6FF", "#7B1FA2"),  # Purple with cowboy
+    "📜": ("COMMISSIONER", "#ECEFF1", "#455A64"),  # Blue-gray
+    "👤": ("YOUR TEAM", "#E8EAF6", "#3F51B5"),  # Indigo for user
+    "💭": ("System", "#FFF9C4", "#FBC02D"),  # Light yellow for loading/system messages
+}
+
+
+def _message_box_open(bg_color: str, border_color: str) -> str:
+    """Opening tag of a colored message box."""
+    return (f'<div style="background-color: {bg_color}; '
+            f'border-left: 4px solid {border_color}; '
+            f'padding: 15px; border-radius: 8px; margin: 10px 0;">\n\n')
+
+
+# Message box openings, built once per style instead of on every message
+MESSAGE_BOX_OPEN = {icon: _message_box_open(bg, border) for icon, (_, bg, border) in AGENT_STYLES.items()}
+DEFAULT_MESSAGE_BOX_OPEN = _message_box_open("#FFFFFF", "#000000")
+
+
 def format_agent_message(agent, recipient: str, message: str, 
                         show_arrow: bool = True) -> str:
     """Format an agent message with proper styling."""
@@ -18,24 +49,6 @@ def format_agent_message(agent, recipient: str, message: str,
         team_name = agent.replace("typing_", "")
         return f'<div style="font-style: italic; margin: 5px 0;">💭 *{team_name} is typing...*</div>\n\n'
     
-    # Agent colors and styles
-    agent_styles = {
-        "📘": ("Team 1", "#E3F2FD", "#1976D2"),  # Blue
-        "📘🤓": ("Team 1", "#E3F2FD", "#1976D2"),  # Blue with nerd emoji
-        "📗": ("Team 2", "#E8F5E9", "#388E3C"),  # Green
-        "📗🧑‍💼": ("Team 2", "#E8F5E9", "#388E3C"),  # Green with business person
-        "📗👨‍🏫": ("Team 6", "#E8F5E9", "#388E3C"),  # Green with professor
-        "📙": ("Team 3", "#FFF3E0", "#F57C00"),  # Orange
-        "📙🧔": ("Team 3", "#FFF3E0", "#F57C00"),  # Orange with beard
-        "📕": ("Your Advisor", "#FFEBEE", "#D32F2F"),  # Red
-        "📕🧙": ("Your Advisor", "#FFEBEE", "#D32F2F"),  # Red with wizard
-        "📓": ("Team 5", "#F5E6FF", "#7B1FA2"),  # Purple
-        "📓🤠": ("Team 5", "#F5E6FF", "#7B1FA2"),  # Purple with cowboy
-        "📜": ("COMMISSIONER", "#ECEFF1", "#455A64"),  # Blue-gray
-        "👤": ("YOUR TEAM", "#E8EAF6", "#3F51B5"),  # Indigo for user
-        "💭": ("System", "#FFF9C4", "#FBC02D"),  # Light yellow for loading/system messages
-    }
-    
     if hasattr(agent, 'icon'):
         icon = agent.icon
         # Include person emoji if available
@@ -62,35 +75,23 @@ def format_agent_message(agent, recipient: str, message: str,
         else:
             return message
     
-    style = agent_styles.get(icon, ("Unknown", "#FFFFFF", "#000000"))
-    bg_color, border_color = style[1], style[2]
-    
-    # Build the message box with more specific color
-    html = f'<div style="background-color: {bg_color}; '
-    html += f'border-left: 4px solid {border_color}; '
-    html += f'padding: 15px; border-radius: 8px; margin: 10px 0;">\n\n'
+    box_open = MESSAGE_BOX_OPEN.get(icon, DEFAULT_MESSAGE_BOX_OPEN)
     
     # Header with sender/recipient
     if agent == "system" or icon == "💭":
         # System messages are centered and italicized - no color specified, let CSS handle it
-        html = f'<div style="text-align: center; margin: 10px 0;">\n\n'
-        html += f'<span>*{message}*</span>\n\n'
-        html += '</div>\n\n'
-        return html
+        return f'<div style="text-align: center; margin: 10px 0;">\n\n<span>*{message}*</span>\n\n</div>\n\n'
     elif recipient == "ALL":
-        html += f'<span>**{icon} {name}**</span>\n\n'
+        header = f'**{icon} {name}**'
     elif recipient == "USER":
-        html += f'<span>**{icon} {name} → You**</span>\n\n'
+        header = f'**{icon} {name} → You**'
     elif show_arrow:
-        html += f'<span>**{icon} {name} → {recipient}**</span>\n\n'
+        header = f'**{icon} {name} → {recipient}**'
     else:
-        html += f'<span>**{icon} {name}**</span>\n\n'
+        header = f'**{icon} {name}**'
     
     # Message content - no color specified, let CSS handle it
-    html += f'{message}\n\n'
-    html += '</div>\n\n'
-    
-    return html
+    return f'{box_open}<span>{header}</span>\n\n{message}\n\n</div>\n\n'
 
 
 def format_conversation_block(messages: list) -> str:
@@ -123,11 +124,12 @@ def format_memory_indicator(round_num: int, memories: list) -> str:
 def create_mock_draft_visualization(draft: MultiAgentMockDraft, 
                                   round_num: int, pick_num: int) -> str:
     """Create a visual representation of the current draft state."""
-    output = f"### 📋 Draft Board - Round {round_num}, Pick {pick_num}\n\n"
-    
-    # Create a simple draft board
-    output += "| Team | Round 1 | Round 2 | Round 3 |\n"
-    output += "|------|---------|---------|----------|\n"
+    # Collect the board's lines and join once at the end
+    lines = [
+        f"### 📋 Draft Board - Round {round_num}, Pick {pick_num}\n",
+        "| Team | Round 1 | Round 2 | Round 3 |",
+        "|------|---------|---------|----------|",
+    ]
     
     for team_num in range(1, 7):  # Show all 6 teams
         if team_num == draft.user_position:
@@ -137,18 +139,10 @@ def create_mock_draft_visualization(draft: MultiAgentMockDraft,
             team_name = agent.team_name if agent else f"Team {team_num}"
         
         picks = draft.draft_board.get(team_num, [])
-        row = f"| {team_name} "
-        
-        for round_idx in range(3):
-            if round_idx < len(picks):
-                row += f"| {picks[round_idx]} "
-            else:
-                row += "| - "
-        
-        row += "|\n"
-        output += row
+        cells = [picks[round_idx] if round_idx < len(picks) else "-" for round_idx in range(3)]
+        lines.append(f"| {team_name} | {' | '.join(cells)} |")
     
-    return output
+    return "\n".join(lines) + "\n"
 
 
 def run_interactive_mock_draft(custom_prompts=None):
@@ -191,19 +185,22 @@ def run_interactive_mock_draft(custom_prompts=None):
             
             # Show draft board at start of round
             if pick_in_round == 1:
-                yield create_mock_draft_visualization(draft, round_num, pick_num)
-                yield "\n"
-            
-            # Process the pick
-            messages, waiting_for_user = draft.simulate_draft_turn(round_num, pick_num, team_num)
+                output += create_mock_draft_visualization(draft, round_num, pick_num)
+                output += "\n"
+                yield output
             
-            # Show loading animation for AI agents
+            # Show loading indicator for AI agents while their LLM calls run
             if team_num != draft.user_position and team_num in draft.agents:
                 agent = draft.agents[team_num]
                 loading_msg = f"💭 *{agent.team_name} is contemplating their pick...*"
                 output += format_agent_message("system", "ALL", loading_msg)
                 yield output
-                time.sleep(0.3)  # Brief pause for loading effect
+            
+            # Process the pick; the following AI pick runs while this one plays back,
+            # but never while the user is on the clock
+            messages, waiting_for_user = draft.take_draft_turn(round_num, pick_num, team_num)
+            if waiting_for_user is not None:
+                draft.prefetch_next_turn(pick_num)
             
             # Display messages with delays
             for msg in messages:
@@ -230,7 +227,7 @@ def run_interactive_mock_draft(custom_prompts=None):
                 if team_num in draft.agents:
                     agent = draft.agents[team_num]
                     if len(agent.picks) > 1:
-                        memory = f"{agent.team_name} has drafted: {', '.join(agent.picks)}"
+                        memory = f"{agent.team_name} has drafted: {agent.picks_str}"
                         draft_memories.append(memory)
                 
                 if draft_memories:
@@ -250,6 +247,26 @@ def run_interactive_mock_draft(custom_prompts=None):
     yield output
 
 
+# Static footer for the quick demo - built once at import
+QUICK_DEMO_FEATURES = (
+    "\n## 🎯 Key Multi-Agent Features Demonstrated\n\n"
+    "✅ **Agent-to-Agent Communication**: Direct responses between agents\n"
+    "✅ **Strategy Awareness**: Agents know and react to others' strategies\n"
+    "✅ **Memory Persistence**: Agents reference earlier statements\n"
+    "✅ **Dynamic Adaptation**: Strategies influence the draft flow\n"
+)
+
+
+class MockAgent:
+    """Lightweight stand-in agent used to format scripted demo messages."""
+    
+    TEAM_NAMES = {"📘": "Team 1", "📗": "Team 2", "📙": "Team 3", "📓": "Team 5"}
+    
+    def __init__(self, icon: str):
+        self.icon = icon
+        self.team_name = self.TEAM_NAMES.get(icon, "Unknown")
+
+
 def create_quick_multiagent_demo():
     """Create a quick demonstration of multi-agent communication."""
     
@@ -267,17 +284,6 @@ def create_quick_multiagent_demo():
     output += "## Turn 1: The First Pick Debate\n\n"
     
     for icon, recipient, message in messages:
-        # Create a mock agent for formatting
-        class MockAgent:
-            def __init__(self, icon):
-                self.icon = icon
-                if icon == "📘":
-                    self.team_name = "Team 1"
-                elif icon == "📙":
-                    self.team_name = "Team 3"
-                elif icon == "📗":
-                    self.team_name = "Team 2"
-        
         agent = MockAgent(icon)
         output += format_agent_message(agent, recipient, message)
         yield output
@@ -303,16 +309,10 @@ def create_quick_multiagent_demo():
     
     for icon, recipient, message in messages2:
         agent = MockAgent(icon)
-        if icon == "📓":
-            agent.team_name = "Team 5"
         output += format_agent_message(agent, recipient, message)
         yield output
         time.sleep(0.5)
     
-    output += "\n## 🎯 Key Multi-Agent Features Demonstrated\n\n"
-    output += "✅ **Agent-to-Agent Communication**: Direct responses between agents\n"
-    output += "✅ **Strategy Awareness**: Agents know and react to others' strategies\n"
-    output += "✅ **Memory Persistence**: Agents reference earlier statements\n"
-    output += "✅ **Dynamic Adaptation**: Strategies influence the draft flow\n"
+    output += QUICK_DEMO_FEATURES
     
     yield output 
\ No newline at end of file
@@ -1,6 +1,5 @@
 """Core module for Fantasy Draft Agent."""
 
-from .agent import FantasyDraftAgent
 from .data import TOP_PLAYERS, get_player_info, get_best_available, get_players_by_position
 
 __all__ = [
@@ -9,4 +8,12 @@ __all__ = [
     'get_player_info',
     'get_best_available',
     'get_players_by_position'
-] 
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    # Import the agent lazily so data-only imports skip the any-agent/LLM stack
+    if name == 'FantasyDraftAgent':
+        from .agent import FantasyDraftAgent
+        return FantasyDraftAgent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,31 +4,42 @@ Supports multi-turn conversations and maintains draft state.
 """
 
 import os
+from collections import deque
 from typing import List, Dict, Optional, Annotated
 from dotenv import load_dotenv
 from any_agent import AnyAgent, AgentConfig
 from .data import TOP_PLAYERS, get_player_info, get_best_available, get_players_by_position
+from .llm_cache import ResponseCache
 
 # Load environment variables from .env file
 load_dotenv()
 
-# Check if API key is available
+# Check once per process if API key is available (HF Spaces secrets are plain env vars)
 if not os.getenv("OPENAI_API_KEY"):
     print("WARNING: OPENAI_API_KEY not found in environment")
-    # Try to get it from HF Spaces secrets
-    import os
-    api_key = os.environ.get("OPENAI_API_KEY", "")
-    if api_key:
-        os.environ["OPENAI_API_KEY"] = api_key
-        print("Successfully loaded API key from environment")
+
+# Exact-match response cache shared by all agents in the process.
+# Opt in with FDA_LLM_CACHE=1 to replay identical prompts without an API call.
+LLM_CACHE_ENABLED = os.getenv("FDA_LLM_CACHE") == "1"
+response_cache = ResponseCache()
+
+# Conversation exchanges replayed into each prompt; older turns are dropped
+CONVERSATION_WINDOW = 3
 
 
 class FantasyDraftAgent:
-    def __init__(self, framework: str = "tinyagent", model_id: str = "gpt-4o-mini", custom_instructions: Optional[str] = None):
+    def __init__(self, framework: str = "tinyagent", model_id: str = "gpt-4o-mini", custom_instructions: Optional[str] = None,
+                 max_tokens: Optional[int] = None):
         """Initialize the Fantasy Draft Agent."""
         self.framework = framework
         self.model_id = model_id
         self.custom_instructions = custom_instructions
+        self.max_tokens = max_tokens
+        
+        # Shared model arguments; max_tokens caps the length of each completion
+        model_args = {"temperature": 0.7}
+        if max_tokens:
+            model_args["max_tokens"] = max_tokens
         
         # Draft state management
         self.draft_state = {
@@ -40,8 +51,9 @@ class FantasyDraftAgent:
             "roster_needs": {
                 "QB": 1, "RB": 2, "WR": 2, "TE": 1, "FLEX": 1
             },
-            "conversation_history": []
+            "conversation_history": deque(maxlen=CONVERSATION_WINDOW)
         }
+        self._draft_context_cache = None  # Rebuilt only when the draft state changes
         
         # Initialize the agent with tools
         try:
@@ -61,7 +73,7 @@ class FantasyDraftAgent:
                     self._get_team_stack_options,
                 ],
                 model_args={
-                    "temperature": 0.7,
+                    **model_args,
                     "api_key": api_key  # Explicitly pass API key
                 }
             )
@@ -79,7 +91,7 @@ class FantasyDraftAgent:
                         model_id=model_id,
                         instructions=self._get_instructions(),
                         model_args={
-                            "temperature": 0.7,
+                            **model_args,
                             "api_key": api_key
                         }
                     )
@@ -147,7 +159,7 @@ class FantasyDraftAgent:
     ) -> str:
         """Analyze scarcity at a position based on remaining players."""
         available = get_players_by_position(position)
-        drafted = [p for p in self.draft_state["all_picks"] if p in available]
+        drafted = {p for p in self.draft_state["all_picks"] if p in available}
         remaining = len(available) - len(drafted)
         
         # Count by tier
@@ -169,8 +181,9 @@ class FantasyDraftAgent:
         team: Annotated[str, "Team abbreviation (e.g., KC, BUF, MIA)"]
     ) -> str:
         """Get stacking options for a specific team."""
+        drafted = set(self.draft_state["all_picks"])
         team_players = {name: info for name, info in TOP_PLAYERS.items() 
-                       if info.get('team') == team and name not in self.draft_state["all_picks"]}
+                       if info.get('team') == team and name not in drafted}
         
         if not team_players:
             return f"No available players from {team}"
@@ -190,31 +203,39 @@ class FantasyDraftAgent:
         # Update round
         total_picks = len(self.draft_state["all_picks"])
         self.draft_state["round"] = (total_picks // self.draft_state["league_size"]) + 1
+        self._draft_context_cache = None
     
-    def run(self, prompt: str, maintain_context: bool = True) -> str:
+    def run(self, prompt: str, maintain_context: bool = True, bypass_cache: bool = False) -> str:
         """Run the agent with a prompt, maintaining conversation context."""
         try:
-            # Build context from previous conversation if needed
+            # Put the draft state first: it only changes when the draft state is
+            # updated, while the history window slides on every call, so this
+            # order lets consecutive calls share the header as a prompt prefix
+            draft_context = self._build_draft_context()
             if maintain_context and self.draft_state["conversation_history"]:
                 context = self._build_conversation_context()
-                full_prompt = f"{context}\n\nCurrent message: {prompt}"
+                full_prompt = f"{draft_context}\n\n{context}\n\nCurrent message: {prompt}"
             else:
-                full_prompt = prompt
+                full_prompt = f"{draft_context}\n\n{prompt}"
             
-            # Add current draft state to prompt
-            draft_context = self._build_draft_context()
-            full_prompt = f"{draft_context}\n\n{full_prompt}"
-            
-            # Run the agent
-            trace = self.agent.run(full_prompt)
+            # Run the agent, reusing a cached response for an identical prompt
+            use_cache = LLM_CACHE_ENABLED and not bypass_cache
+            cache_key = response_cache.make_key(
+                self.framework, self.model_id, str(self.max_tokens), self._get_instructions(), full_prompt
+            ) if use_cache else None
+            response = response_cache.get(cache_key) if use_cache else None
+            if response is None:
+                response = self.agent.run(full_prompt).final_output
+                if use_cache:
+                    response_cache.put(cache_key, response)
             
             # Store conversation turn
             self.draft_state["conversation_history"].append({
                 "user": prompt,
-                "agent": trace.final_output
+                "agent": response
             })
             
-            return trace.final_output
+            return response
         except Exception as e:
             print(f"Error in agent.run(): {e}")
             print(f"Prompt was: {prompt[:200]}...")
@@ -227,9 +248,8 @@ class FantasyDraftAgent:
             return ""
         
         context = "Previous conversation:\n"
-        # Include last 3 exchanges for context
-        recent_history = self.draft_state["conversation_history"][-3:]
-        for turn in recent_history:
+        # History only holds the last CONVERSATION_WINDOW exchanges
+        for turn in self.draft_state["conversation_history"]:
             context += f"User: {turn['user']}\n"
             context += f"Assistant: {turn['agent']}\n\n"
         
@@ -237,6 +257,9 @@ class FantasyDraftAgent:
     
     def _build_draft_context(self) -> str:
         """Build context about current draft state."""
+        if self._draft_context_cache is not None:
+            return self._draft_context_cache
+        
         context = f"Current draft state:\n"
         context += f"Round: {self.draft_state['round']}\n"
         context += f"Your pick number: {self.draft_state['pick_number']}\n"
@@ -248,6 +271,7 @@ class FantasyDraftAgent:
             recent_picks = self.draft_state["all_picks"][-5:]
             context += f"Recent picks: {', '.join(recent_picks)}\n"
         
+        self._draft_context_cache = context
         return context
     
     def reset_draft(self):
@@ -261,27 +285,28 @@ class FantasyDraftAgent:
             "roster_needs": {
                 "QB": 1, "RB": 2, "WR": 2, "TE": 1, "FLEX": 1
             },
-            "conversation_history": []
+            "conversation_history": deque(maxlen=CONVERSATION_WINDOW)
         }
+        self._draft_context_cache = None
 
 
 # Simple test function
 def test_agent():
-    """Test the fantasy draft agent."""
+    """Test the fantasy draft agent against the live model, skipping the response cache."""
     agent = FantasyDraftAgent()
     
     # Test basic question
-    response = agent.run("What are the top 3 RBs available?")
+    response = agent.run("What are the top 3 RBs available?", bypass_cache=True)
     print("Agent:", response)
     print("\n" + "="*50 + "\n")
     
     # Test multi-turn conversation
-    response = agent.run("I have the 5th pick. The first 4 picks were McCaffrey, Jefferson, Lamb, and Hill. What should I do?")
+    response = agent.run("I have the 5th pick. The first 4 picks were McCaffrey, Jefferson, Lamb, and Hill. What should I do?", bypass_cache=True)
     print("Agent:", response)
     print("\n" + "="*50 + "\n")
     
     # Follow-up that should remember context
-    response = agent.run("What about taking a WR instead?")
+    response = agent.run("What about taking a WR instead?", bypass_cache=True)
     print("Agent:", response)
 
 
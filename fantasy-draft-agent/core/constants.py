@@ -2,6 +2,11 @@
 Constants for the Fantasy Draft Multi-Agent implementation.
 """
 
+import os
+
+# Verbose debug logging - opt in with FDA_DEBUG=1
+DEBUG_LOGGING = os.getenv("FDA_DEBUG") == "1"
+
 # Timing constants (in seconds)
 TYPING_DELAY_SECONDS = 0.5
 MESSAGE_DELAY_SECONDS = 1.0
@@ -9,6 +14,16 @@ MESSAGE_DELAY_SECONDS = 1.0
 # Comment configuration
 MAX_COMMENTS_PER_PICK = 1  # Reduced for more concise draft flow
 
+# Conversation memory entries each agent keeps for its replies
+RECENT_MEMORY_SIZE = 5
+
+# Completion caps: picks/comments ask for 1-2 sentences, advice for a few bullets
+AGENT_MAX_TOKENS = 120
+ADVISOR_MAX_TOKENS = 350
+
+# Most responses the opt-in LLM cache keeps before evicting the least recently used
+LLM_CACHE_MAX_ENTRIES = 512
+
 # Natural rivalry pairs for prioritizing comments
 RIVAL_PAIRS = {
     1: 3,      # Zero RB vs Robust RB - natural enemies!
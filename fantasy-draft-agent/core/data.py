@@ -67,6 +67,12 @@ TOP_PLAYERS = {
 }
 
 
+# Display labels like "Josh Allen (QB, BUF)", built once since TOP_PLAYERS is static
+PLAYER_LABELS = {name: f"{name} ({info['pos']}, {info['team']})" for name, info in TOP_PLAYERS.items()}
+
+# Player names ordered by ADP (best first); stable, so ties keep TOP_PLAYERS order
+PLAYERS_BY_ADP = sorted(TOP_PLAYERS, key=lambda name: TOP_PLAYERS[name]["adp"])
+
 def get_player_info(player_name: str) -> dict:
     """Get player information by name."""
     return TOP_PLAYERS.get(player_name, {})
@@ -84,7 +90,8 @@ def get_players_by_tier(tier: int) -> dict:
 
 def get_available_players(drafted_players: list) -> dict:
     """Get all players not yet drafted."""
-    return {name: info for name, info in TOP_PLAYERS.items() if name not in drafted_players}
+    drafted = set(drafted_players)
+    return {name: info for name, info in TOP_PLAYERS.items() if name not in drafted}
 
 
 def get_best_available(drafted_players: list, position: str = None) -> tuple:
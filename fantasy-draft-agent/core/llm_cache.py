@@ -0,0 +1,47 @@
+"""
+Exact-match response cache for Fantasy Draft Agent LLM calls.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from .constants import LLM_CACHE_MAX_ENTRIES
+
+
+class ResponseCache:
+    """In-process LRU cache of LLM responses keyed by a hash of the full request."""
+    
+    def __init__(self, max_entries: int = LLM_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        # Agents run on background workers and across sessions, so guard reordering
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """Hash the parts that determine a response (model, instructions, prompt)."""
+        payload = "\x1f".join(parts)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for a key, if any."""
+        with self._lock:
+            response = self._entries.get(key)
+            if response is not None:
+                self._entries.move_to_end(key)
+            return response
+    
+    def put(self, key: str, response: str):
+        """Store a response under a key, evicting the least recently used past the limit."""
+        with self._lock:
+            self._entries[key] = response
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def clear(self):
+        """Drop all cached responses."""
+        with self._lock:
+            self._entries.clear()